@@ -8,10 +8,18 @@ based on job descriptions using AI analysis.
 
 import os
 import json
+import uuid
+import shutil
+import time
 import datetime
-from flask import Flask, render_template, request, redirect, url_for, flash, send_from_directory
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, send_from_directory
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
+import anthropic
+import httpx
 from resume_tailor import ResumeTailor
 
 # Load environment variables from .env file if present
@@ -23,20 +31,46 @@ app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'dev-secret-key')
 # Configure upload folder
 UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
 ALLOWED_EXTENSIONS = {'tex', 'txt', 'pdf'}
+UPLOAD_CHUNK_SIZE = 64 * 1024
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# One long-lived connection pool for all Claude calls, so worker threads reuse
+# warm TLS connections (multiplexed over HTTP/2 when the h2 package is installed)
+http_client = anthropic.DefaultHttpxClient(
+    http2=importlib.util.find_spec('h2') is not None,
+    limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300)
+)
+
 # Initialize ResumeTailor
 tailor = ResumeTailor(
     api_key=os.environ.get('ANTHROPIC_API_KEY'),
     output_dir=os.environ.get('OUTPUT_DIR', './resume_output'),
-    verbose=False  # Disable terminal spinner for web app
+    verbose=False,  # Disable terminal spinner for web app
+    http_client=http_client
 )
+tailor.client  # Create the Claude client now so a missing API key fails at startup
+
+# Background workers for tailoring jobs so requests don't block on Claude/pdflatex
+executor = ThreadPoolExecutor(max_workers=int(os.environ.get('TAILOR_WORKERS', '2')))
+tasks = {}
+TASK_RETENTION_SECONDS = 30 * 60
+DOWNLOAD_MAX_AGE = 24 * 60 * 60
+# Each progress stream holds a request thread, so end it after this long and
+# let the status page reconnect rather than tie the thread up for a whole job
+EVENT_STREAM_SECONDS = 60
 
 def allowed_file(filename):
     """Check if the file has an allowed extension."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+@app.errorhandler(413)
+def upload_too_large(error):
+    """Reject uploads larger than MAX_CONTENT_LENGTH."""
+    flash('Upload is too large. The limit is 5 MB per request.')
+    return redirect(url_for('tailor_resume'))
+
 @app.route('/')
 def home():
     """Render the home page."""
@@ -46,72 +80,162 @@ def home():
 def tailor_resume():
     """Handle resume tailoring requests."""
     if request.method == 'POST':
-        # Check if resume file was uploaded
-        if 'resume_file' not in request.files:
-            flash('No resume file selected')
-            return redirect(request.url)
-            
-        resume_file = request.files['resume_file']
+        # One or more resume files may be uploaded against the same job description
+        resume_files = [f for f in request.files.getlist('resume_file') if f.filename]
         
         # If user submits without selecting a file
-        if resume_file.filename == '':
+        if not resume_files:
             flash('No resume file selected')
             return redirect(request.url)
             
         # Get job description
-        job_description = request.form.get('job_description', '').strip()
-        job_title = request.form.get('job_title', '').strip()
-        company = request.form.get('company', '').strip()
+        form = request.form
+        job_description = form.get('job_description', '').strip()
+        job_title = form.get('job_title', '').strip()
+        company = form.get('company', '').strip()
         
         if not job_description:
             flash('Job description is required')
             return redirect(request.url)
             
-        if resume_file and allowed_file(resume_file.filename):
-            # Save the uploaded resume file
-            filename = secure_filename(resume_file.filename)
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            resume_file.save(file_path)
-            
-            try:
-                # Tailor the resume
-                new_file_path = tailor.tailor_resume(
-                    file_path,
-                    job_description,
-                    job_title=job_title,
-                    company=company
-                )
-                
-                # Get the latest application ID
-                application_id = tailor.applications[-1]['id']
-                
-                # Redirect to the result page
-                return redirect(url_for('result', application_id=application_id))
-                
-            except Exception as e:
-                flash(f'Error tailoring resume: {str(e)}')
-                return redirect(request.url)
-        else:
+        if not all(allowed_file(f.filename) for f in resume_files):
             flash('Invalid file type. Please upload a .tex file')
             return redirect(request.url)
             
+        # Queue one tailoring job per resume and let the status page follow them
+        futures = []
+        progress = ['Waiting for a free worker...'] * len(resume_files)
+        for index, resume_file in enumerate(resume_files):
+            file_path = save_upload(resume_file)
+            futures.append(executor.submit(
+                run_tailor_task,
+                file_path,
+                job_description,
+                job_title=job_title,
+                company=company,
+                # Each job reports its latest status message into its own progress slot
+                on_progress=functools.partial(progress.__setitem__, index)
+            ))
+        
+        prune_tasks()
+        task_id = uuid.uuid4().hex
+        tasks[task_id] = (time.time(), futures, progress)
+        
+        return redirect(url_for('task_status', task_id=task_id))
+            
     return render_template('tailor.html')
 
+def save_upload(upload):
+    """Stream an uploaded file to the upload folder and return its path."""
+    # Give each upload its own directory so users uploading files with the same
+    # name don't overwrite each other, while the tailored resume keeps the name
+    upload_dir = os.path.join(app.config['UPLOAD_FOLDER'], uuid.uuid4().hex)
+    os.makedirs(upload_dir)
+    file_path = os.path.join(upload_dir, secure_filename(upload.filename))
+    
+    # Copy in fixed-size chunks so memory stays bounded regardless of file size
+    with open(file_path, 'wb') as dst:
+        shutil.copyfileobj(upload.stream, dst, UPLOAD_CHUNK_SIZE)
+        
+    return file_path
+
+def prune_tasks():
+    """Drop finished jobs whose status page was never visited."""
+    cutoff = time.time() - TASK_RETENTION_SECONDS
+    for task_id, (created, futures, _) in list(tasks.items()):
+        if created < cutoff and all(future.done() for future in futures):
+            tasks.pop(task_id, None)
+
+def run_tailor_task(file_path, job_description, job_title=None, company=None, on_progress=None):
+    """Tailor a resume in a background worker and return its application ID."""
+    application = tailor.tailor_resume(
+        file_path,
+        job_description,
+        job_title=job_title,
+        company=company,
+        on_progress=on_progress
+    )
+    return application['id']
+
+@app.route('/status/<task_id>')
+def task_status(task_id):
+    """Show progress of queued tailoring jobs, redirecting once they finish."""
+    entry = tasks.get(task_id)
+    
+    if entry is None:
+        flash('Tailoring job not found')
+        return redirect(url_for('tailor_resume'))
+        
+    _, futures, _ = entry
+    
+    if not all(future.done() for future in futures):
+        return render_template('status.html', task_id=task_id)
+        
+    tasks.pop(task_id, None)
+    
+    application_ids = []
+    for future in futures:
+        try:
+            application_ids.append(future.result())
+        except Exception as e:
+            flash(f'Error tailoring resume: {str(e)}')
+            
+    if len(futures) > 1:
+        flash(f'Tailored {len(application_ids)} of {len(futures)} resumes')
+        return redirect(url_for('list_applications'))
+        
+    if not application_ids:
+        return redirect(url_for('tailor_resume'))
+        
+    return redirect(url_for('result', application_id=application_ids[0]))
+
+@app.route('/status/<task_id>/events')
+def task_events(task_id):
+    """Stream progress of queued tailoring jobs to the status page as Server-Sent Events."""
+    entry = tasks.get(task_id)
+    
+    if entry is None:
+        return Response('event: done\ndata: \n\n', mimetype='text/event-stream')
+        
+    _, futures, progress = entry
+    
+    def describe_progress():
+        if len(futures) == 1:
+            return progress[0]
+        finished = sum(1 for future in futures if future.done())
+        return f'{finished} of {len(futures)} resumes finished'
+    
+    def generate():
+        last_message = None
+        deadline = time.monotonic() + EVENT_STREAM_SECONDS
+        while not all(future.done() for future in futures):
+            if time.monotonic() > deadline:
+                # Closing the stream makes the page reload and open a fresh one
+                return
+            message = describe_progress()
+            if message != last_message:
+                yield f'data: {message}\n\n'
+                last_message = message
+            else:
+                # Writing every tick is what reveals a closed tab, via a broken pipe
+                yield ': keepalive\n\n'
+            time.sleep(0.5)
+        yield 'event: done\ndata: \n\n'
+    
+    return Response(generate(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
 @app.route('/applications')
 def list_applications():
     """List all applications."""
+    # The log is append-only in creation order, so the template can show it
+    # newest-first by iterating in reverse instead of sorting on every request
     applications = tailor.applications
     return render_template('applications.html', applications=applications)
 
 @app.route('/result/<int:application_id>')
 def result(application_id):
     """Show the result of a tailored resume."""
-    # Find the application by ID
-    application = None
-    for app in tailor.applications:
-        if app['id'] == application_id:
-            application = app
-            break
+    application = tailor.get_application(application_id)
             
     if not application:
         flash('Application not found')
@@ -124,15 +248,22 @@ def download_file(filename):
     """Download a file from the resume output directory."""
     directory = os.path.dirname(filename)
     filename = os.path.basename(filename)
-    return send_from_directory(directory, filename, as_attachment=True)
+    # Tailored resumes are never overwritten (each save gets a fresh file name), so the
+    # browser can reuse its copy for a while; private keeps shared proxies from storing
+    # someone's resume
+    response = send_from_directory(directory, filename, as_attachment=True, max_age=DOWNLOAD_MAX_AGE)
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
 
 @app.route('/update/<int:application_id>', methods=['POST'])
 def update_application(application_id):
     """Update application status."""
-    applied = 'applied' in request.form
-    company = request.form.get('company', '').strip()
-    job_link = request.form.get('job_link', '').strip()
-    notes = request.form.get('notes', '').strip()
+    form = request.form
+    applied = 'applied' in form
+    company = form.get('company', '').strip()
+    job_link = form.get('job_link', '').strip()
+    notes = form.get('notes', '').strip()
     
     success = tailor.update_application_status(
         application_id,
@@ -11,16 +11,200 @@ import sys
 import argparse
 import json
 import logging
+import logging.handlers
+import queue
 import datetime
 import subprocess
 import tempfile
-import anthropic
-import re
-import time
+import asyncio
+import shutil
+import shlex
+import hashlib
 import threading
 import itertools
+import atexit
+import uuid
+from functools import cached_property, lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the standard library is used without it
+    orjson = None
+
+
+CLAUDE_MODEL = "claude-3-7-sonnet-20250219"
+
+# Transient 429/5xx errors are retried by the SDK with exponential backoff
+CLAUDE_MAX_RETRIES = 4
+
+# Shape of the job analysis returned by Claude
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "key_skills": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Key skills and requirements from the job description"
+        },
+        "missing_skills": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Skills in the job description that don't appear in the resume"
+        },
+        "title_suggestions": {
+            "type": "object",
+            "description": "Original job titles mapped to titles better aligned with the target position"
+        },
+        "experience_suggestions": {
+            "type": "object",
+            "description": "Section identifiers mapped to experience text that highlights relevant skills"
+        },
+        "content_additions": {
+            "type": "object",
+            "description": "Section names mapped to content to add to the resume"
+        }
+    },
+    "required": ["key_skills", "missing_skills", "title_suggestions", "experience_suggestions", "content_additions"]
+}
+
+# Tool Claude is forced to call so the standalone analysis arrives as parsed JSON
+ANALYSIS_TOOL = {
+    "name": "submit_job_analysis",
+    "description": "Submit the analysis of the job description against the resume.",
+    "input_schema": ANALYSIS_SCHEMA
+}
+
+# Tool Claude is forced to call so analysis and tailored LaTeX arrive as one structured response
+TAILOR_TOOL = {
+    "name": "submit_tailored_resume",
+    "description": "Submit the job description analysis together with the complete tailored LaTeX resume.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "analysis": ANALYSIS_SCHEMA,
+            "latex": {
+                "type": "string",
+                "description": "The complete modified LaTeX resume, ready to compile"
+            }
+        },
+        "required": ["analysis", "latex"]
+    }
+}
+
+TAILOR_SYSTEM_PROMPT = """You are an expert resume tailoring assistant and LaTeX editor. You will be given a LaTeX resume and a job description.
+
+First analyze the job description against the resume: identify the key skills, the skills missing from the resume, job title adjustments, experience descriptions to enhance, and content to add.
+
+Then modify the LaTeX resume to incorporate that analysis. Focus on:
+1. Adjusting job titles if suggested
+2. Enhancing experience descriptions to highlight relevant skills
+3. Adding any missing skills that the candidate genuinely has
+4. Making the resume more ATS-friendly for this specific job
+
+Never invent experience or skills; improve ATS compatibility while maintaining the truth of the resume. The LaTeX must be complete and compile correctly. Submit both results with the submit_tailored_resume tool."""
+
+ANALYSIS_SYSTEM_PROMPT = "You are an expert resume tailoring assistant that helps customize resumes for specific job descriptions."
+
+CUSTOMIZE_SYSTEM_PROMPT = """You are an expert LaTeX resume editor. Your task is to modify a LaTeX resume based on analysis to better target a specific job.
+
+Modify the LaTeX resume to incorporate the suggestions from the analysis. Focus on:
+1. Adjusting job titles if suggested
+2. Enhancing experience descriptions to highlight relevant skills
+3. Adding any missing skills that the candidate genuinely has
+4. Making the resume more ATS-friendly for this specific job
+
+Return ONLY the complete modified LaTeX code with no additional comments or explanations. The code should be valid LaTeX that will compile correctly."""
+
+# Extra records tolerated in the applications log before it is compacted on load
+LOG_COMPACTION_SLACK = 50
+
+# --list labels, indexed by whether the application was submitted
+APPLICATION_STATUS_LABELS = ("📝 Not Applied", "✅ Applied")
+
+
+def _json_dumps(obj):
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=32)
+def _read_text_cached(path, mtime_ns):
+    """Read a UTF-8 text file; mtime_ns is part of the cache key so edits are picked up."""
+    return Path(path).read_text(encoding='utf-8')
+
+
+def _strip_latex_comments(latex_content):
+    """Remove %-comments from LaTeX source, keeping escaped \\% characters.
+    
+    A % starts a comment unless an odd number of backslashes precedes it
+    (so "\\%" is a literal percent sign but "\\\\%" is a line break and a comment).
+    """
+    lines = []
+    for line in latex_content.split('\n'):
+        start = 0
+        while True:
+            percent = line.find('%', start)
+            if percent == -1:
+                break
+            backslashes = 0
+            while percent - backslashes > 0 and line[percent - backslashes - 1] == '\\':
+                backslashes += 1
+            if backslashes % 2 == 0:
+                line = line[:percent]
+                break
+            start = percent + 1
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def _count_group_braces(latex_content):
+    """Count the unescaped { and } in comment-free LaTeX source.
+    
+    A brace is a literal character only when an odd number of backslashes
+    precedes it, so the "\\\\" line break next to a group brace still counts.
+    
+    Returns:
+        tuple: (opening braces, closing braces)
+    """
+    open_braces = close_braces = 0
+    backslashes = 0
+    for char in latex_content:
+        if char == '\\':
+            backslashes += 1
+            continue
+        if backslashes % 2 == 0:
+            if char == '{':
+                open_braces += 1
+            elif char == '}':
+                close_braces += 1
+        backslashes = 0
+    return open_braces, close_braces
+
+
+def _strip_code_fence(text):
+    """Return the body of the first markdown code fence in text, or text unchanged if there is none."""
+    fence_start = text.find('```')
+    if fence_start == -1:
+        return text
+        
+    # The body starts after the opening fence line (which may carry a language tag)
+    body_start = text.find('\n', fence_start)
+    body_end = text.find('\n```', body_start)
+    if body_start == -1 or body_end == -1:
+        return text
+        
+    return text[body_start + 1:body_end]
+
 
 class Spinner:
     """A simple terminal spinner for long-running processes."""
@@ -37,13 +221,16 @@ class Spinner:
         self.spinner_cycle = itertools.cycle(['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏'])
         self.running = False
         self.spinner_thread = None
+        self.animated = sys.stdout.isatty()
+        self._stopped = threading.Event()
     
     def spin(self):
         """The spinner animation function that runs in a thread."""
         while self.running:
             sys.stdout.write(f"\r{next(self.spinner_cycle)} {self.message}")
             sys.stdout.flush()
-            time.sleep(self.delay)
+            # Sleeps between frames but wakes as soon as stop() is called
+            self._stopped.wait(self.delay)
     
     def start(self, message=None):
         """Start the spinner animation.
@@ -55,6 +242,15 @@ class Spinner:
             self.message = message
             
         self.running = True
+        self._stopped.clear()
+        
+        # Redirected output (logs, CI, pipes) gets the message once instead of frames
+        self.animated = sys.stdout.isatty()
+        if not self.animated:
+            sys.stdout.write(f"{self.message}\n")
+            sys.stdout.flush()
+            return
+            
         self.spinner_thread = threading.Thread(target=self.spin)
         self.spinner_thread.daemon = True
         self.spinner_thread.start()
@@ -66,8 +262,16 @@ class Spinner:
             message: Optional completion message to display.
         """
         self.running = False
+        self._stopped.set()
         if self.spinner_thread:
             self.spinner_thread.join()
+            self.spinner_thread = None
+        
+        if not self.animated:
+            if message:
+                sys.stdout.write(f"{message}\n")
+                sys.stdout.flush()
+            return
         
         # Clear the line
         sys.stdout.write('\r' + ' ' * (len(self.message) + 10))
@@ -82,17 +286,29 @@ class Spinner:
 
 
 class ResumeTailor:
-    """Main class for tailoring resumes to job descriptions."""
+    """Main class for tailoring resumes to job descriptions.
+    
+    All Claude calls sample with temperature 0.0, so identical inputs give
+    reproducible output and the on-disk response cache stays consistent.
+    """
 
-    def __init__(self, api_key=None, output_dir=None, verbose=True):
+    def __init__(self, api_key=None, output_dir=None, verbose=True, http_client=None,
+                 analysis_max_tokens=1500, max_output_tokens=8000, use_cache=True):
         """Initialize the resume tailoring tool.
 
         Args:
             api_key: Anthropic API key. If None, will look for ANTHROPIC_API_KEY environment variable.
             output_dir: Directory to store outputs. If None, defaults to './resume_output'.
             verbose: Whether to show loading animations and status messages.
+            http_client: Optional httpx.Client for Claude requests, e.g. a shared pooled client.
+            analysis_max_tokens: Output token budget for the job description analysis.
+            max_output_tokens: Upper bound on the output token budget of any Claude call.
+            use_cache: Whether to reuse cached Claude responses; fresh ones are cached either way.
         """
         self.verbose = verbose
+        self.use_cache = use_cache
+        self.analysis_max_tokens = analysis_max_tokens
+        self.max_output_tokens = max_output_tokens
         
         # Setup loading spinner
         self.spinner = Spinner()
@@ -101,58 +317,320 @@ class ResumeTailor:
         self.output_dir = output_dir or './resume_output'
         self.resumes_dir = os.path.join(self.output_dir, 'resumes')
         self.log_dir = os.path.join(self.output_dir, 'logs')
+        self.cache_dir = os.path.join(self.output_dir, 'cache')
         
-        # Create all necessary directories
-        os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(self.resumes_dir, exist_ok=True)
-        os.makedirs(self.log_dir, exist_ok=True)
-        
+        # Subdirectories are created by whatever first writes to them; the log
+        # directory (and with it output_dir) is needed right away for logging
         self._setup_logging()
 
-        # Initialize Claude client
+        # Claude clients are created on first use (see client/aclient), so commands
+        # that never call the API don't pay for importing the SDK or need a key
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
+        self._http_client = http_client
+        
+        # Log store for applications (append-only JSONL, replayed on first access)
+        self.applications_log_file = os.path.join(self.output_dir, 'applications.jsonl')
+        self._log_record_count = 0
+        self._applications = None
+        self._applications_by_id = None
+        self._max_application_id = 0
+        self._log_load_lock = threading.Lock()
+        
+        # Guards the applications log when tailoring runs in worker threads
+        self._lock = threading.Lock()
+        
+        # Resume paths picked by saves that haven't written their .tex yet
+        self._reserved_paths = set()
+        
+        # pdflatex results for documents already validated in this process
+        self._validation_results = {}
+        
+        # Cache entry each customize_resume() result came from, so LaTeX that fails to
+        # compile can be evicted instead of being served again on the next run
+        self._latex_cache_entries = {}
+        
+        # Tokens billed across all Claude calls made by this instance
+        self.token_usage = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0
+        }
+
+    def _require_api_key(self):
+        """Return the Anthropic API key, exiting if none was configured."""
         if not self.api_key:
             self.logger.error("No Anthropic API key provided. Set ANTHROPIC_API_KEY environment variable or pass via --api-key.")
             sys.exit(1)
+        return self.api_key
+
+    @cached_property
+    def client(self):
+        """Synchronous Claude client, created on first access."""
+        import anthropic
+        return anthropic.Anthropic(
+            api_key=self._require_api_key(),
+            http_client=self._http_client,
+            max_retries=CLAUDE_MAX_RETRIES
+        )
+
+    @cached_property
+    def aclient(self):
+        """Asynchronous Claude client, created on first access."""
+        import anthropic
+        return anthropic.AsyncAnthropic(
+            api_key=self._require_api_key(),
+            max_retries=CLAUDE_MAX_RETRIES
+        )
+
+    def _latex_max_tokens(self, latex_content):
+        """Output token budget for rewriting a LaTeX document of the given size.
         
-        self.client = anthropic.Anthropic(api_key=self.api_key)
-        
-        # Log store for applications
-        self.applications_log_file = os.path.join(self.output_dir, 'applications.json')
-        self.applications = self._load_applications_log()
+        A tailored resume stays close to the original length, and LaTeX runs at
+        roughly three characters per token; the headroom covers added content.
+        """
+        return min(self.max_output_tokens, len(latex_content) // 3 + 1000)
+
+    @cached_property
+    def _validate_dir(self):
+        """Scratch directory reused by every validate_latex call, removed at exit."""
+        validate_dir = tempfile.mkdtemp(prefix='rt_validate_')
+        atexit.register(shutil.rmtree, validate_dir, ignore_errors=True)
+        return validate_dir
 
     def _setup_logging(self):
         """Configure logging for the application."""
+        os.makedirs(self.log_dir, exist_ok=True)
         log_file = os.path.join(self.log_dir, f'resume_tailor_{datetime.datetime.now().strftime("%Y%m%d")}.log')
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler() if not self.verbose else logging.NullHandler()
-            ]
-        )
+        # basicConfig only configures the root logger once per process
+        if not logging.getLogger().handlers:
+            # File writes happen on a listener thread; logging calls only enqueue
+            log_queue = queue.Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, logging.FileHandler(log_file))
+            listener.start()
+            atexit.register(listener.stop)
+            
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[
+                    logging.handlers.QueueHandler(log_queue),
+                    logging.StreamHandler() if not self.verbose else logging.NullHandler()
+                ]
+            )
         
         self.logger = logging.getLogger('resume_tailor')
         self.logger.info("ResumeTailor initialized")
 
+    @property
+    def applications(self):
+        """Application entries in creation order, read from the log on first access."""
+        self._ensure_applications_loaded()
+        return self._applications
+
+    @property
+    def _apps_by_id(self):
+        """Application entries keyed by ID."""
+        self._ensure_applications_loaded()
+        return self._applications_by_id
+
+    def _ensure_applications_loaded(self):
+        """Replay the applications log the first time the applications are needed."""
+        if self._applications is not None:
+            return
+            
+        with self._log_load_lock:
+            if self._applications is not None:
+                return
+                
+            applications = self._load_applications_log()
+            
+            # Fold accumulated update records back into one record per application. This
+            # runs before the entries are published so no other thread can append to the
+            # log while it is being rewritten.
+            if self._log_record_count > 2 * len(applications) + LOG_COMPACTION_SLACK:
+                self._compact_applications_log(applications)
+                
+            self._applications_by_id = {app["id"]: app for app in applications}
+            # Not len() + 1 for new IDs: an unreadable record skipped on replay would make that reuse an ID
+            self._max_application_id = max(self._applications_by_id, default=0)
+            self._applications = applications
+
     def _load_applications_log(self):
-        """Load the applications log file or create if it doesn't exist."""
-        if os.path.exists(self.applications_log_file):
-            try:
-                with open(self.applications_log_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                self.logger.warning(f"Could not parse applications log file. Creating new one.")
-                return []
-        else:
+        """Load the applications log by replaying its records.
+        
+        Each line is either a "create" record holding a full application entry or an
+        "update" record holding the fields that changed. A log from before the JSONL
+        format (applications.json) is migrated on first load.
+        
+        Returns:
+            list: Application entries in creation order.
+        """
+        if not os.path.exists(self.applications_log_file):
+            return self._migrate_legacy_applications_log()
+            
+        applications = []
+        apps_by_id = {}
+        
+        with open(self.applications_log_file, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                    
+                try:
+                    record = _json_loads(line)
+                except json.JSONDecodeError:
+                    # Most likely a write cut short by a crash; earlier records are intact
+                    self.logger.warning(f"Skipping unreadable record on line {line_number} of applications log.")
+                    continue
+                    
+                self._log_record_count += 1
+                
+                if record.get("op") == "update":
+                    app = apps_by_id.get(record.get("id"))
+                    if app is not None:
+                        app.update(record.get("changes", {}))
+                else:
+                    entry = record["entry"]
+                    applications.append(entry)
+                    apps_by_id[entry["id"]] = entry
+                    
+        return applications
+
+    def _next_application_id(self):
+        """Allocate the ID for a new application. Call with self._lock held."""
+        self._ensure_applications_loaded()
+        self._max_application_id += 1
+        return self._max_application_id
+
+    def _migrate_legacy_applications_log(self):
+        """Import applications.json from older versions into the JSONL log."""
+        legacy_file = os.path.join(self.output_dir, 'applications.json')
+        if not os.path.exists(legacy_file):
+            return []
+            
+        try:
+            with open(legacy_file, 'rb') as f:
+                applications = _json_loads(f.read())
+        except json.JSONDecodeError:
+            self.logger.warning(f"Could not parse legacy applications log {legacy_file}. Starting a new one.")
             return []
+            
+        self.logger.info(f"Migrating {len(applications)} application(s) from {legacy_file}")
+        self._write_applications_log(applications)
+        return applications
 
-    def _save_applications_log(self):
-        """Save the applications log to disk."""
-        with open(self.applications_log_file, 'w') as f:
-            json.dump(self.applications, f, indent=2)
+    def _append_log_record(self, record):
+        """Append a single record to the applications log.
+        
+        O_APPEND writes of one line are atomic, so a crash can at worst lose the
+        record being written, never corrupt earlier ones.
+        """
+        data = _json_dumps(record) + b"\n"
+        fd = os.open(self.applications_log_file, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            # Terminate a line left unfinished by a crash, or this record would be glued onto it
+            size = os.fstat(fd).st_size
+            if size and os.pread(fd, 1, size - 1) != b"\n":
+                data = b"\n" + data
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+            
+        self._log_record_count += 1
+
+    def _write_applications_log(self, applications):
+        """Rewrite the log with one create record per application, atomically."""
+        fd, temp_path = tempfile.mkstemp(dir=self.output_dir, suffix='.tmp')
+        # mkstemp creates the file 0600; match the mode _append_log_record creates the log with
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            for app in applications:
+                f.write(_json_dumps({"op": "create", "entry": app}) + b"\n")
+                
+        os.replace(temp_path, self.applications_log_file)
+        self._log_record_count = len(applications)
+
+    def _compact_applications_log(self, applications):
+        """Drop superseded update records from the applications log."""
+        self.logger.info(f"Compacting applications log ({self._log_record_count} records)")
+        self._write_applications_log(applications)
+
+    def _cache_key(self, *parts):
+        """Build a content-addressed cache key from the inputs of a Claude call.
+        
+        Args:
+            parts: Strings that fully determine the response (model, prompts, inputs).
+            
+        Returns:
+            str: Hex digest identifying the response.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            data = part.encode('utf-8')
+            # Length-prefix each part so different splits of the same text can't collide
+            digest.update(len(data).to_bytes(8, 'little'))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _tailor_cache_key(self, job_description, resume_content):
+        """Cache key for the combined analyze-and-customize call."""
+        return self._cache_key(
+            CLAUDE_MODEL, TAILOR_SYSTEM_PROMPT, json.dumps(TAILOR_TOOL, sort_keys=True), resume_content, job_description
+        )
+
+    def _read_cache(self, kind, key):
+        """Return a cached Claude response, or None on a cache miss."""
+        if not self.use_cache:
+            return None
+            
+        cache_file = os.path.join(self.cache_dir, f"{kind}_{key}.json")
+        if not os.path.exists(cache_file):
+            return None
+            
+        try:
+            with open(cache_file, 'rb') as f:
+                entry = _json_loads(f.read())
+        except (OSError, json.JSONDecodeError):
+            self.logger.warning(f"Could not read cache entry {cache_file}. Ignoring it.")
+            return None
+            
+        self.logger.info(f"Cache hit for {kind} ({key[:12]})")
+        return entry.get("content")
+
+    def _write_cache(self, kind, key, content):
+        """Store a Claude response in the cache."""
+        cache_file = os.path.join(self.cache_dir, f"{kind}_{key}.json")
+        entry = {
+            "content": content,
+            "created_at": datetime.datetime.now().isoformat()
+        }
+        
+        # Write to a temp file first so concurrent readers never see a partial entry
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_json_dumps(entry))
+            os.replace(temp_path, cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache entry {cache_file}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _evict_cache(self, kind, key):
+        """Drop a cached Claude response, e.g. one whose LaTeX failed to compile."""
+        cache_file = os.path.join(self.cache_dir, f"{kind}_{key}.json")
+        try:
+            os.remove(cache_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Could not remove cache entry {cache_file}: {e}")
+        else:
+            self.logger.info(f"Evicted {kind} cache entry ({key[:12]})")
 
     def read_latex_resume(self, file_path):
         """Read the original LaTeX resume file.
@@ -164,8 +642,9 @@ class ResumeTailor:
             str: Content of the LaTeX file.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # The same base resume is usually tailored many times per process
+            path = os.path.abspath(file_path)
+            content = _read_text_cached(path, os.stat(path).st_mtime_ns)
             
             self.logger.info(f"Successfully read LaTeX resume from {file_path}")
             return content
@@ -185,62 +664,80 @@ class ResumeTailor:
         """
         self.logger.info("Analyzing job description with Claude API")
         
-        if self.verbose:
-            self.spinner.start("Analyzing job description with Claude API (this may take a minute)...")
+        # The resume goes first as its own block so repeated analyses of the same
+        # resume against different job descriptions reuse Claude's prompt cache
+        resume_block = f"""# Current Resume (LaTeX format):
+```latex
+{resume_content}
+```"""
         
         prompt = f"""
-        You are an expert resume tailoring assistant. Your task is to analyze a job description and a resume, then provide guidance on tailoring the resume to better match the job requirements.
+        You are an expert resume tailoring assistant. Your task is to analyze a job description and the resume above, then provide guidance on tailoring the resume to better match the job requirements.
 
         # Job Description:
         ```
         {job_description}
         ```
 
-        # Current Resume (LaTeX format):
-        ```latex
-        {resume_content}
-        ```
-
-        Please provide a structured analysis in JSON format with the following information:
+        Please submit a structured analysis with the submit_job_analysis tool, containing the following information:
         1. "key_skills": Extract the key skills and requirements from the job description (array of strings)
         2. "missing_skills": Identify skills in the job description that don't appear in the resume (array of strings)
         3. "title_suggestions": Suggest how to modify job titles to better align with the target position (object with original titles as keys and suggested titles as values)
         4. "experience_suggestions": Suggest modifications to experience descriptions to highlight relevant skills (object with section identifiers as keys and suggested text as values)
         5. "content_additions": Suggest additional content to add to the resume (object with section names as keys and content to add as values)
 
-        Your response should be valid JSON that can be parsed programmatically. Focus on making changes that will improve ATS compatibility while maintaining the truth of the resume.
+        Focus on making changes that will improve ATS compatibility while maintaining the truth of the resume.
         """
         
+        # Key on the full prompt and tool schema so editing either invalidates old entries
+        cache_key = self._cache_key(
+            CLAUDE_MODEL, ANALYSIS_SYSTEM_PROMPT, json.dumps(ANALYSIS_TOOL, sort_keys=True), resume_block, prompt
+        )
+        cached = self._read_cache('analysis', cache_key)
+        if cached is not None:
+            if self.verbose:
+                print("✓ Using cached job description analysis.")
+            return cached
+        
+        if self.verbose:
+            self.spinner.start("Analyzing job description with Claude API (this may take a minute)...")
+        
         try:
-            response = self.client.messages.create(
-                model="claude-3-7-sonnet-20250219",
-                max_tokens=4000,
-                temperature=0.2,
-                system="You are an expert resume tailoring assistant that helps customize resumes for specific job descriptions. Provide only valid JSON in your response.",
-                messages=[{"role": "user", "content": prompt}]
-            )
+            with self.client.messages.stream(
+                model=CLAUDE_MODEL,
+                max_tokens=self.analysis_max_tokens,
+                temperature=0.0,
+                system=ANALYSIS_SYSTEM_PROMPT,
+                tools=[ANALYSIS_TOOL],
+                tool_choice={"type": "tool", "name": ANALYSIS_TOOL["name"]},
+                messages=[{
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": resume_block, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": prompt}
+                    ]
+                }]
+            ) as stream:
+                response = stream.get_final_message()
+            self._record_usage("Analysis", response.usage)
             
-            # Extract JSON from the response
-            response_text = response.content[0].text
-            # Find JSON content (in case there's additional text)
-            json_pattern = r'({[\s\S]*})'
-            json_match = re.search(json_pattern, response_text)
+            # A truncated tool call has partial input that must not be cached
+            if response.stop_reason == "max_tokens":
+                raise ValueError("Claude's job description analysis was cut off at the output token limit")
             
-            if json_match:
-                json_str = json_match.group(1)
-                analysis = json.loads(json_str)
-                self.logger.info("Successfully analyzed job description")
-                
-                if self.verbose:
-                    self.spinner.stop("✓ Job description analyzed successfully.")
-                
-                return analysis
-            else:
-                if self.verbose:
-                    self.spinner.stop("✗ Failed to extract valid data from response.")
-                
-                self.logger.error("Failed to extract JSON from Claude response")
-                raise ValueError("Could not extract valid JSON from the AI response")
+            # The forced tool call carries the analysis as already-parsed JSON
+            tool_use = next((block for block in response.content if block.type == "tool_use"), None)
+            if tool_use is None:
+                raise ValueError("Claude did not return a job description analysis")
+            
+            analysis = tool_use.input
+            self.logger.info("Successfully analyzed job description")
+            self._write_cache('analysis', cache_key, analysis)
+            
+            if self.verbose:
+                self.spinner.stop("✓ Job description analyzed successfully.")
+            
+            return analysis
                 
         except Exception as e:
             if self.verbose:
@@ -261,51 +758,70 @@ class ResumeTailor:
         """
         self.logger.info("Customizing resume based on analysis")
         
-        if self.verbose:
-            self.spinner.start("Customizing resume based on job requirements...")
+        # Static content first (system prompt, then the resume) so Anthropic's
+        # prompt cache can reuse the prefix when the same resume is tailored again
+        system = [{
+            "type": "text",
+            "text": CUSTOMIZE_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
         
-        prompt = f"""
-        You are an expert LaTeX resume editor. Your task is to modify a LaTeX resume based on analysis to better target a specific job.
-
-        # Original Resume (LaTeX format):
-        ```latex
-        {original_latex}
-        ```
-
-        # Analysis to incorporate:
-        ```json
-        {json.dumps(analysis, indent=2)}
-        ```
-
-        Please modify the LaTeX resume to incorporate the suggestions from the analysis. Focus on:
-        1. Adjusting job titles if suggested
-        2. Enhancing experience descriptions to highlight relevant skills
-        3. Adding any missing skills that the candidate genuinely has
-        4. Making the resume more ATS-friendly for this specific job
+        resume_block = f"""# Original Resume (LaTeX format):
+```latex
+{original_latex}
+```"""
+        
+        # Compact JSON in the prompt; indentation would only add input tokens
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Analysis sent for customization:\n{json.dumps(analysis, indent=2)}")
+        
+        analysis_block = f"""# Analysis to incorporate:
+```json
+{_json_dumps(analysis).decode('utf-8')}
+```
 
-        Return ONLY the complete modified LaTeX code with no additional comments or explanations. The code should be valid LaTeX that will compile correctly.
-        """
+Please modify the LaTeX resume above to incorporate the suggestions from the analysis."""
+        
+        # Key on the full prompt so editing it invalidates old entries
+        cache_key = self._cache_key(CLAUDE_MODEL, CUSTOMIZE_SYSTEM_PROMPT, resume_block, analysis_block)
+        cached = self._read_cache('resume', cache_key)
+        if cached is not None:
+            if self.verbose:
+                print("✓ Using cached resume customization.")
+            self._latex_cache_entries[self._cache_key(cached)] = ('resume', cache_key)
+            return cached
+        
+        if self.verbose:
+            self.spinner.start("Customizing resume based on job requirements...")
         
         try:
-            response = self.client.messages.create(
-                model="claude-3-7-sonnet-20250219",
-                max_tokens=4000,
-                temperature=0.2,
-                system="You are an expert LaTeX editor. Return only valid LaTeX code with no additional text.",
-                messages=[{"role": "user", "content": prompt}]
-            )
+            with self.client.messages.stream(
+                model=CLAUDE_MODEL,
+                max_tokens=self._latex_max_tokens(original_latex),
+                temperature=0.0,
+                system=system,
+                messages=[{
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": resume_block, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": analysis_block}
+                    ]
+                }]
+            ) as stream:
+                response_text = "".join(stream.text_stream)
+                response = stream.get_final_message()
             
-            # Extract LaTeX content
-            response_text = response.content[0].text
+            self._record_usage("Customize", response.usage)
+            
+            if response.stop_reason == "max_tokens":
+                raise ValueError("Claude's resume was cut off at the output token limit")
             
             # Strip any markdown code blocks if present
-            latex_content = response_text
-            if "```latex" in latex_content:
-                latex_content = re.search(r'```latex\n([\s\S]*?)\n```', latex_content).group(1)
-            elif "```" in latex_content:
-                latex_content = re.search(r'```\n([\s\S]*?)\n```', latex_content).group(1)
+            latex_content = _strip_code_fence(response_text)
                 
             self.logger.info("Successfully customized resume")
+            self._write_cache('resume', cache_key, latex_content)
+            self._latex_cache_entries[self._cache_key(latex_content)] = ('resume', cache_key)
             
             if self.verbose:
                 self.spinner.stop("✓ Resume customized successfully.")
@@ -319,6 +835,229 @@ class ResumeTailor:
             self.logger.error(f"Error customizing resume: {e}")
             raise
 
+    def analyze_and_customize(self, job_description, resume_content, on_progress=None):
+        """Analyze the job description and tailor the resume in a single Claude call.
+        
+        Equivalent to analyze_job_description() followed by customize_resume(), but the
+        resume is sent once and only one round-trip is made.
+        
+        Args:
+            job_description: Text of the job description.
+            resume_content: Text of the original resume.
+            on_progress: Optional callable receiving status messages while the response streams in.
+            
+        Returns:
+            tuple: (analysis dict, modified LaTeX content).
+        """
+        self.logger.info("Analyzing job description and customizing resume with Claude API")
+        
+        cache_key = self._tailor_cache_key(job_description, resume_content)
+        cached = self._read_cache('tailor', cache_key)
+        if cached is not None:
+            if self.verbose:
+                print("✓ Using cached analysis and tailored resume.")
+            return cached["analysis"], cached["latex"]
+        
+        if self.verbose:
+            self.spinner.start("Tailoring resume with Claude API (this may take a minute)...")
+        
+        try:
+            with self.client.messages.stream(**self._tailor_request(job_description, resume_content)) as stream:
+                # Stream so callers can show progress instead of waiting for the full response
+                received = 0
+                for event in stream:
+                    if event.type == "input_json" and on_progress:
+                        received += len(event.partial_json)
+                        on_progress(f"Receiving tailored resume from Claude ({received:,} characters)...")
+                        
+                response = stream.get_final_message()
+            
+            analysis, latex_content = self._parse_tailor_response(response)
+            
+            self.logger.info("Successfully analyzed job description and customized resume")
+            self._write_cache('tailor', cache_key, {"analysis": analysis, "latex": latex_content})
+            
+            if self.verbose:
+                self.spinner.stop("✓ Resume tailored successfully.")
+                
+            return analysis, latex_content
+            
+        except Exception as e:
+            if self.verbose:
+                self.spinner.stop(f"✗ Error tailoring resume: {e}")
+                
+            self.logger.error(f"Error analyzing and customizing resume: {e}")
+            raise
+
+    async def analyze_and_customize_async(self, job_description, resume_content):
+        """Async variant of analyze_and_customize() for running many jobs concurrently.
+        
+        Args:
+            job_description: Text of the job description.
+            resume_content: Text of the original resume.
+            
+        Returns:
+            tuple: (analysis dict, modified LaTeX content).
+        """
+        cache_key = self._tailor_cache_key(job_description, resume_content)
+        cached = self._read_cache('tailor', cache_key)
+        if cached is not None:
+            return cached["analysis"], cached["latex"]
+            
+        response = await self.aclient.messages.create(**self._tailor_request(job_description, resume_content))
+        analysis, latex_content = self._parse_tailor_response(response)
+        
+        self.logger.info("Successfully analyzed job description and customized resume")
+        self._write_cache('tailor', cache_key, {"analysis": analysis, "latex": latex_content})
+        return analysis, latex_content
+
+    def _tailor_request(self, job_description, resume_content):
+        """Build the Messages API arguments for the combined analyze-and-customize call."""
+        return {
+            "model": CLAUDE_MODEL,
+            "max_tokens": min(
+                self.max_output_tokens,
+                self.analysis_max_tokens + self._latex_max_tokens(resume_content)
+            ),
+            "temperature": 0.0,
+            "system": [{
+                "type": "text",
+                "text": TAILOR_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"}
+            }],
+            "tools": [TAILOR_TOOL],
+            "tool_choice": {"type": "tool", "name": TAILOR_TOOL["name"]},
+            "messages": [{
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": f"# Current Resume (LaTeX format):\n```latex\n{resume_content}\n```",
+                        "cache_control": {"type": "ephemeral"}
+                    },
+                    {"type": "text", "text": f"# Job Description:\n```\n{job_description}\n```"}
+                ]
+            }]
+        }
+
+    def _record_usage(self, call_name, usage):
+        """Add a response's token usage to the running totals and log it.
+        
+        Args:
+            call_name: Label for the call in the log.
+            usage: The response's usage object.
+        """
+        counts = {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+            "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0
+        }
+        with self._lock:
+            for name, count in counts.items():
+                self.token_usage[name] += count
+                
+        self.logger.info(
+            f"{call_name} call used {counts['input_tokens']} uncached input tokens, "
+            f"{counts['cache_read_input_tokens']} read from and {counts['cache_creation_input_tokens']} "
+            f"written to the prompt cache, and {counts['output_tokens']} output tokens"
+        )
+
+    def _parse_tailor_response(self, response):
+        """Extract (analysis, LaTeX) from the submit_tailored_resume tool call in a response."""
+        self._record_usage("Tailor", response.usage)
+        
+        if response.stop_reason == "max_tokens":
+            raise ValueError("Claude's tailored resume was cut off at the output token limit")
+            
+        tool_use = next((block for block in response.content if block.type == "tool_use"), None)
+        if tool_use is None:
+            raise ValueError("Claude did not return a tailored resume")
+            
+        # Callers (the batch loop in particular) only expect ValueError for a bad response
+        missing = [field for field in ("analysis", "latex") if field not in tool_use.input]
+        if missing:
+            raise ValueError(f"Claude's tailored resume is missing {', '.join(missing)}")
+            
+        # The model occasionally still wraps the document in a code fence
+        return tool_use.input["analysis"], _strip_code_fence(tool_use.input["latex"])
+
+    def _quick_latex_check(self, latex_content, check_nesting=False):
+        """Cheaply reject LaTeX that cannot possibly compile, before running pdflatex.
+        
+        Args:
+            latex_content: LaTeX content to check.
+            check_nesting: Also run the heuristic brace and \\begin/\\end nesting checks.
+                Only worth it when pdflatex is just validating: a % inside \\url or
+                \\verb, or a macro that opens an environment, can make them reject a
+                document that compiles fine.
+            
+        Returns:
+            bool: False if the document structure is clearly broken.
+        """
+        # Commented-out source is invisible to TeX, so it can't break the structure
+        latex_content = _strip_latex_comments(latex_content)
+        
+        problem = None
+        if '\\documentclass' not in latex_content:
+            problem = "missing \\documentclass"
+        elif latex_content.count('\\begin{document}') != 1 or latex_content.count('\\end{document}') != 1:
+            problem = "expected exactly one document environment"
+        elif check_nesting:
+            open_braces, close_braces = _count_group_braces(latex_content)
+            if open_braces != close_braces:
+                problem = f"unbalanced braces ({open_braces} opening, {close_braces} closing)"
+            else:
+                # Only the document body; the preamble is where macros wrap environments
+                body_start = latex_content.index('\\begin{document}') + len('\\begin{document}')
+                body_end = latex_content.index('\\end{document}')
+                problem = self._environment_mismatch(latex_content[body_start:body_end])
+            
+        if problem:
+            self.logger.error(f"LaTeX pre-check failed: {problem}")
+            return False
+            
+        return True
+
+    def _environment_mismatch(self, latex_content):
+        """Check that \\begin{...} and \\end{...} pairs nest correctly.
+        
+        Args:
+            latex_content: LaTeX content to check.
+            
+        Returns:
+            str: Description of the first mismatch, or None if environments nest.
+        """
+        open_envs = []
+        begin_at = latex_content.find('\\begin{')
+        end_at = latex_content.find('\\end{')
+        
+        while begin_at != -1 or end_at != -1:
+            if end_at == -1 or (begin_at != -1 and begin_at < end_at):
+                name_start = begin_at + len('\\begin{')
+                name_end = latex_content.find('}', name_start)
+                if name_end == -1:
+                    return "unterminated \\begin"
+                open_envs.append(latex_content[name_start:name_end])
+                begin_at = latex_content.find('\\begin{', name_end)
+            else:
+                name_start = end_at + len('\\end{')
+                name_end = latex_content.find('}', name_start)
+                if name_end == -1:
+                    return "unterminated \\end"
+                name = latex_content[name_start:name_end]
+                if not open_envs:
+                    return f"\\end{{{name}}} without matching \\begin"
+                if open_envs[-1] != name:
+                    return f"\\end{{{name}}} closes \\begin{{{open_envs[-1]}}}"
+                open_envs.pop()
+                end_at = latex_content.find('\\end{', name_end)
+        
+        if open_envs:
+            return f"\\begin{{{open_envs[-1]}}} is never closed"
+        
+        return None
+
     def validate_latex(self, latex_content):
         """Validate that the LaTeX content compiles correctly.
         
@@ -330,59 +1069,78 @@ class ResumeTailor:
         """
         self.logger.info("Validating LaTeX compilation")
         
+        if not self._quick_latex_check(latex_content, check_nesting=True):
+            if self.verbose:
+                print("✗ LaTeX is malformed; skipping compilation.")
+            
+            return False
+        
+        content_key = self._cache_key(latex_content)
+        if content_key in self._validation_results:
+            self.logger.info("Using cached LaTeX validation result")
+            return self._validation_results[content_key]
+        
         if self.verbose:
             self.spinner.start("Validating LaTeX compilation...")
         
-        # Create temporary directory for compilation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_file = os.path.join(temp_dir, "resume_temp.tex")
-            
-            # Write content to temporary file
-            with open(temp_file, "w", encoding="utf-8") as f:
-                f.write(latex_content)
+        # Unique per call so concurrent validations can share the directory
+        base_name = f"resume_temp_{uuid.uuid4().hex}"
+        try:
+            is_valid = self._run_pdflatex(latex_content, self._validate_dir, base_name, draft=True)
+        finally:
+            for leftover in Path(self._validate_dir).glob(f"{base_name}.*"):
+                leftover.unlink(missing_ok=True)
+        self._validation_results[content_key] = is_valid
+        
+        if is_valid:
+            self.logger.info("LaTeX compilation successful")
+        
+        if self.verbose:
+            self.spinner.stop("✓ LaTeX compilation successful." if is_valid else "✗ LaTeX compilation failed.")
+        
+        return is_valid
+
+    def _reserve_resume_path(self, stem):
+        """Pick a .tex path in the resumes directory that no other resume uses.
+        
+        Tailoring the same resume to the same title twice in a day (or two batch
+        jobs whose files share a name) would otherwise overwrite the earlier
+        resume and leave two log entries pointing at one file.
+        
+        Args:
+            stem: Preferred file name without extension.
             
-            # Try to compile
-            try:
-                result = subprocess.run(
-                    ["pdflatex", "-interaction=nonstopmode", "-output-directory", temp_dir, temp_file],
-                    capture_output=True,
-                    text=True,
-                    check=False
+        Returns:
+            Path: Path for the new .tex file, reserved until released by the caller.
+        """
+        resumes_path = Path(self.resumes_dir)
+        with self._lock:
+            for attempt in itertools.count(1):
+                candidate = resumes_path / (f"{stem}.tex" if attempt == 1 else f"{stem}_{attempt}.tex")
+                taken = (
+                    candidate in self._reserved_paths
+                    or candidate.exists()
+                    or candidate.with_suffix('.pdf').exists()
                 )
-                
-                if result.returncode != 0:
-                    self.logger.error(f"LaTeX compilation failed: {result.stderr}")
-                    
-                    if self.verbose:
-                        self.spinner.stop("✗ LaTeX compilation failed.")
-                    
-                    return False
-                
-                self.logger.info("LaTeX compilation successful")
-                
-                if self.verbose:
-                    self.spinner.stop("✓ LaTeX compilation successful.")
-                
-                return True
-                
-            except Exception as e:
-                self.logger.error(f"Error during LaTeX validation: {e}")
-                
-                if self.verbose:
-                    self.spinner.stop(f"✗ Error during LaTeX validation: {e}")
-                
-                return False
+                if not taken:
+                    self._reserved_paths.add(candidate)
+                    return candidate
 
-    def save_tailored_resume(self, latex_content, original_file, job_title=None):
+    def save_tailored_resume(self, latex_content, original_file, job_title=None, company=None, show_progress=True):
         """Save the tailored resume to the output directory.
         
         Args:
             latex_content: Modified LaTeX content.
             original_file: Path to the original resume file.
             job_title: Optional job title for the filename.
+            company: Optional company name for the applications log.
+            show_progress: Whether to show the compile spinner (when verbose).
             
         Returns:
-            str: Path to the new file.
+            dict: The new applications log entry, including its ID and file paths.
+            
+        Raises:
+            ValueError: If the LaTeX content does not compile.
         """
         # Generate filename based on original file and date/job
         original_path = Path(original_file)
@@ -390,39 +1148,58 @@ class ResumeTailor:
         
         date_str = datetime.datetime.now().strftime("%Y%m%d")
         job_suffix = f"_{job_title.replace(' ', '_')}" if job_title else ""
-        new_filename = f"{base_name}_tailored{job_suffix}_{date_str}.tex"
         
         # Save to the resumes subdirectory
-        new_path = Path(self.resumes_dir) / new_filename
-        
-        # Save the file
-        with open(new_path, "w", encoding="utf-8") as f:
-            f.write(latex_content)
+        new_path = self._reserve_resume_path(f"{base_name}_tailored{job_suffix}_{date_str}")
+        try:
+            # Compile the PDF first; this single pdflatex run also validates the LaTeX
+            show_spinner = self.verbose and show_progress
+            if show_spinner:
+                self.spinner.start("Compiling LaTeX to PDF...")
+            
+            pdf_output = self._compile_resume_to_pdf(latex_content, new_path.stem)
+            if pdf_output is None:
+                if show_spinner:
+                    self.spinner.stop("✗ LaTeX compilation failed.")
+                
+                cache_entry = self._latex_cache_entries.pop(self._cache_key(latex_content), None)
+                if cache_entry is not None:
+                    self._evict_cache(*cache_entry)
+                
+                raise ValueError("Generated LaTeX content does not compile correctly")
+            
+            if show_spinner:
+                self.spinner.stop("✓ LaTeX compilation successful.")
+            
+            # Save the file
+            new_path.write_text(latex_content, encoding="utf-8")
+        finally:
+            with self._lock:
+                self._reserved_paths.discard(new_path)
             
         self.logger.info(f"Saved tailored resume to {new_path}")
         
-        # Also save the compiled PDF if validation succeeded
-        pdf_output = self._compile_resume_to_pdf(latex_content, new_path.stem)
-        
         # Add to applications log
-        job_entry = {
-            "id": len(self.applications) + 1,
-            "date_created": datetime.datetime.now().isoformat(),
-            "original_resume": str(original_file),
-            "tailored_resume": str(new_path),
-            "pdf_resume": pdf_output,
-            "job_title": job_title or "Untitled Position",
-            "applied": False,
-            "application_date": None,
-            "company": None,
-            "job_link": None,
-            "notes": None
-        }
-        
-        self.applications.append(job_entry)
-        self._save_applications_log()
+        with self._lock:
+            job_entry = {
+                "id": self._next_application_id(),
+                "date_created": datetime.datetime.now().isoformat(),
+                "original_resume": str(original_file),
+                "tailored_resume": str(new_path),
+                "pdf_resume": pdf_output,
+                "job_title": job_title or "Untitled Position",
+                "applied": False,
+                "application_date": None,
+                "company": company or None,
+                "job_link": None,
+                "notes": None
+            }
+            
+            self.applications.append(job_entry)
+            self._apps_by_id[job_entry["id"]] = job_entry
+            self._append_log_record({"op": "create", "entry": job_entry})
         
-        return str(new_path)
+        return job_entry
         
     def _compile_resume_to_pdf(self, latex_content, base_name):
         """Compile the LaTeX content to PDF and save in the output directory.
@@ -434,44 +1211,93 @@ class ResumeTailor:
         Returns:
             str: Path to the PDF file or None if compilation failed.
         """
+        if not self._quick_latex_check(latex_content):
+            return None
+        
         # Create path for the PDF
         pdf_path = os.path.join(self.resumes_dir, f"{base_name}.pdf")
         
-        # Create temporary directory for compilation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_file = os.path.join(temp_dir, f"{base_name}.tex")
-            
-            # Write content to temporary file
-            with open(temp_file, "w", encoding="utf-8") as f:
-                f.write(latex_content)
+        # Compile inside the resumes directory so the PDF can be renamed into
+        # place instead of copied across filesystems
+        os.makedirs(self.resumes_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix='.compile_', dir=self.resumes_dir) as temp_dir:
+            if not self._run_pdflatex(latex_content, temp_dir, base_name):
+                return None
             
-            # Try to compile
-            try:
-                result = subprocess.run(
-                    ["pdflatex", "-interaction=nonstopmode", "-output-directory", temp_dir, temp_file],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
+            # Move the PDF from temp directory to output directory
+            temp_pdf = os.path.join(temp_dir, f"{base_name}.pdf")
+            if not os.path.exists(temp_pdf):
+                self.logger.error("PDF file not found after compilation")
+                return None
                 
-                if result.returncode != 0:
-                    self.logger.error(f"PDF compilation failed: {result.stderr}")
-                    return None
-                
-                # Copy the PDF from temp directory to output directory
-                temp_pdf = os.path.join(temp_dir, f"{base_name}.pdf")
-                if os.path.exists(temp_pdf):
-                    import shutil
-                    shutil.copy2(temp_pdf, pdf_path)
-                    self.logger.info(f"Saved PDF version to {pdf_path}")
-                    return pdf_path
-                else:
-                    self.logger.error("PDF file not found after compilation")
-                    return None
-                    
-            except Exception as e:
-                self.logger.error(f"Error during PDF compilation: {e}")
+            try:
+                os.replace(temp_pdf, pdf_path)
+            except OSError as e:
+                self.logger.error(f"Error saving compiled PDF: {e}")
                 return None
+                
+        self.logger.info(f"Saved PDF version to {pdf_path}")
+        return pdf_path
+
+    def _run_pdflatex(self, latex_content, temp_dir, base_name, draft=False):
+        """Write the LaTeX content into a directory and compile it there with pdflatex.
+        
+        Args:
+            latex_content: LaTeX content to compile.
+            temp_dir: Directory for the .tex source and pdflatex outputs.
+            base_name: Base name for the .tex file (and the resulting .pdf).
+            draft: Only check that the document compiles; skips writing the PDF.
+            
+        Returns:
+            bool: True if pdflatex exited successfully.
+        """
+        temp_file = os.path.join(temp_dir, f"{base_name}.tex")
+        
+        # Write content to temporary file as one raw write, bypassing the text-mode wrapper
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, latex_content.encode("utf-8"))
+        finally:
+            os.close(fd)
+        
+        # Stop at the first error instead of recovering through the rest of the
+        # document, and never run \write18 from model-generated LaTeX
+        command = [
+            "pdflatex", "-interaction=nonstopmode", "-halt-on-error", "-no-shell-escape",
+            "-output-directory", temp_dir, temp_file
+        ]
+        if draft:
+            # -draftmode runs the full TeX pass but skips PDF output and font embedding
+            command.insert(1, "-draftmode")
+        
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                check=False
+            )
+        except Exception as e:
+            self.logger.error(f"Error running pdflatex: {e}")
+            return False
+            
+        if result.returncode != 0:
+            # pdflatex reports errors on stdout; stderr is usually empty
+            self.logger.error(f"LaTeX compilation failed: {result.stderr or result.stdout[-2000:]}")
+            return False
+            
+        return True
+
+    def get_application(self, resume_id):
+        """Look up an application log entry by ID.
+        
+        Args:
+            resume_id: ID of the resume in the applications log.
+            
+        Returns:
+            dict: The application entry, or None if no entry has that ID.
+        """
+        return self._apps_by_id.get(resume_id)
 
     def update_application_status(self, resume_id, applied=True, company=None, job_link=None, notes=None):
         """Update the application status in the log.
@@ -486,29 +1312,33 @@ class ResumeTailor:
         Returns:
             bool: True if updated successfully.
         """
-        for app in self.applications:
-            if app["id"] == resume_id:
-                if applied:
-                    app["applied"] = True
-                    app["application_date"] = datetime.datetime.now().isoformat()
-                
-                if company:
-                    app["company"] = company
-                
-                if job_link:
-                    app["job_link"] = job_link
-                    
-                if notes:
-                    app["notes"] = notes
+        with self._lock:
+            app = self._apps_by_id.get(resume_id)
+            if app is None:
+                self.logger.warning(f"Could not find resume with ID {resume_id}")
+                return False
                 
-                self._save_applications_log()
-                self.logger.info(f"Updated application status for resume ID {resume_id}")
-                return True
+            changes = {}
+            if applied:
+                changes["applied"] = True
+                changes["application_date"] = datetime.datetime.now().isoformat()
+            
+            if company:
+                changes["company"] = company
+            
+            if job_link:
+                changes["job_link"] = job_link
                 
-        self.logger.warning(f"Could not find resume with ID {resume_id}")
-        return False
+            if notes:
+                changes["notes"] = notes
+            
+            if changes:
+                app.update(changes)
+                self._append_log_record({"op": "update", "id": resume_id, "changes": changes})
+            self.logger.info(f"Updated application status for resume ID {resume_id}")
+            return True
 
-    def tailor_resume(self, resume_file, job_description, job_title=None, company=None):
+    def tailor_resume(self, resume_file, job_description, job_title=None, company=None, on_progress=None):
         """Main method to tailor a resume based on a job description.
         
         Args:
@@ -516,9 +1346,10 @@ class ResumeTailor:
             job_description: Text of the job description.
             job_title: Optional job title for logging.
             company: Optional company name for logging.
+            on_progress: Optional callable receiving short status messages as work proceeds.
             
         Returns:
-            str: Path to the tailored resume file.
+            dict: The applications log entry for the tailored resume.
         """
         try:
             if self.verbose:
@@ -530,34 +1361,31 @@ class ResumeTailor:
             # Read the original resume
             original_content = self.read_latex_resume(resume_file)
             
-            # Analyze the job description
-            analysis = self.analyze_job_description(job_description, original_content)
+            # Analyze the job description and customize the resume in one call
+            if on_progress:
+                on_progress("Analyzing job description and tailoring resume...")
+            analysis, tailored_content = self.analyze_and_customize(job_description, original_content, on_progress)
             
-            # Customize the resume
-            tailored_content = self.customize_resume(original_content, analysis)
+            if on_progress:
+                on_progress("Compiling LaTeX to PDF...")
             
-            # Validate the LaTeX
-            is_valid = self.validate_latex(tailored_content)
-            if not is_valid:
+            # Save the tailored resume; its PDF compile doubles as LaTeX validation
+            try:
+                application = self.save_tailored_resume(tailored_content, resume_file, job_title, company)
+            except ValueError:
                 self.logger.error("Tailored resume failed to compile. Aborting.")
+                # Otherwise every retry would get the same broken document back from the cache
+                self._evict_cache('tailor', self._tailor_cache_key(job_description, original_content))
                 
                 if self.verbose:
                     print("\n❌ Error: Generated LaTeX content does not compile correctly.")
                 
-                raise ValueError("Generated LaTeX content does not compile correctly")
+                raise
             
-            # Save the tailored resume
-            new_file_path = self.save_tailored_resume(tailored_content, resume_file, job_title)
-            
-            # Update log with company info if provided
-            if company and len(self.applications) > 0:
-                latest_id = self.applications[-1]["id"]
-                self.update_application_status(latest_id, applied=False, company=company)
-            
-            self.logger.info(f"Resume successfully tailored and saved to {new_file_path}")
+            self.logger.info(f"Resume successfully tailored and saved to {application['tailored_resume']}")
             
             if self.verbose:
-                print(f"\n✅ Resume successfully tailored and saved to: {new_file_path}")
+                print(f"\n✅ Resume successfully tailored and saved to: {application['tailored_resume']}")
                 
                 # Print key insights from the analysis
                 if analysis.get('key_skills'):
@@ -573,7 +1401,7 @@ class ResumeTailor:
                 if analysis.get('title_suggestions') and len(analysis['title_suggestions']) > 0:
                     print(f"✏️ Job titles optimized: {len(analysis['title_suggestions'])}")
                 
-            return new_file_path
+            return application
             
         except Exception as e:
             self.logger.error(f"Error tailoring resume: {e}")
@@ -583,10 +1411,199 @@ class ResumeTailor:
                 
             raise
 
+    async def _tailor_with_batch_api(self, job_descriptions, resume_content, poll_interval=30):
+        """Run the combined analyze-and-customize calls as one Message Batches API job.
+        
+        Batches are billed at half price and don't count against the per-minute rate
+        limits, but results can take minutes to hours, so this suits large sweeps.
+        
+        Args:
+            job_descriptions: List of job description texts.
+            resume_content: Text of the original resume.
+            poll_interval: Seconds to wait between batch status checks.
+            
+        Returns:
+            list: For each job description, an (analysis, LaTeX) tuple or the exception that stopped it.
+        """
+        cache_keys = [
+            self._tailor_cache_key(job_description, resume_content)
+            for job_description in job_descriptions
+        ]
+        responses = [None] * len(job_descriptions)
+        requests = []
+        for index, (job_description, cache_key) in enumerate(zip(job_descriptions, cache_keys)):
+            cached = self._read_cache('tailor', cache_key)
+            if cached is not None:
+                responses[index] = (cached["analysis"], cached["latex"])
+            else:
+                requests.append({
+                    "custom_id": f"job-{index}",
+                    "params": self._tailor_request(job_description, resume_content)
+                })
+                
+        if not requests:
+            return responses
+            
+        batch = await self.aclient.messages.batches.create(requests=requests)
+        self.logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+        
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = await self.aclient.messages.batches.retrieve(batch.id)
+            
+        async for entry in await self.aclient.messages.batches.results(batch.id):
+            index = int(entry.custom_id.split("-", 1)[1])
+            if entry.result.type != "succeeded":
+                responses[index] = ValueError(f"Batch request {entry.custom_id} {entry.result.type}")
+                continue
+                
+            try:
+                analysis, latex_content = self._parse_tailor_response(entry.result.message)
+            except ValueError as e:
+                responses[index] = e
+                continue
+                
+            self._write_cache('tailor', cache_keys[index], {"analysis": analysis, "latex": latex_content})
+            responses[index] = (analysis, latex_content)
+            
+        # Requests the batch never reported on (e.g. it was cancelled) count as failures
+        return [
+            response if response is not None else ValueError(f"No batch result for job {index}")
+            for index, response in enumerate(responses)
+        ]
+
+    async def tailor_many(self, resume_file, job_descriptions, job_titles=None, company=None, max_concurrency=4,
+                          use_batch_api=False):
+        """Tailor one resume to several job descriptions, issuing the Claude calls concurrently.
+        
+        Args:
+            resume_file: Path to the original LaTeX resume.
+            job_descriptions: List of job description texts.
+            job_titles: Optional list of job titles, parallel to job_descriptions.
+            company: Optional company name for logging.
+            max_concurrency: Most Claude requests in flight at once, to stay under rate limits.
+            use_batch_api: Submit the Claude calls as one Message Batches API job instead.
+            
+        Returns:
+            list: For each job description, the applications log entry for its tailored resume
+                or the exception that stopped it.
+        """
+        job_titles = job_titles or [None] * len(job_descriptions)
+        original_content = self.read_latex_resume(resume_file)
+        
+        if self.verbose:
+            self.spinner.start(f"Tailoring resume to {len(job_descriptions)} job descriptions with Claude API...")
+        
+        # Postings that differ only in whitespace share one Claude call
+        unique_descriptions = {}
+        for job_description in job_descriptions:
+            unique_descriptions.setdefault(" ".join(job_description.split()), job_description)
+        distinct = list(unique_descriptions.values())
+        if len(distinct) < len(job_descriptions):
+            self.logger.info(f"Tailoring {len(distinct)} distinct job descriptions out of {len(job_descriptions)}")
+        
+        if use_batch_api:
+            distinct_responses = await self._tailor_with_batch_api(distinct, original_content)
+        else:
+            # The API calls are network-bound, so overlapping them cuts wall time to roughly one call
+            # per max_concurrency jobs; the semaphore keeps a large batch from tripping rate limits
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def tailor_one(job_description):
+                async with semaphore:
+                    return await self.analyze_and_customize_async(job_description, original_content)
+            
+            distinct_responses = await asyncio.gather(
+                *(tailor_one(job_description) for job_description in distinct),
+                return_exceptions=True
+            )
+        
+        response_by_key = dict(zip(unique_descriptions, distinct_responses))
+        responses = [response_by_key[" ".join(job_description.split())] for job_description in job_descriptions]
+        
+        if self.verbose:
+            succeeded = sum(1 for response in responses if not isinstance(response, Exception))
+            self.spinner.stop(f"✓ Received {succeeded} of {len(responses)} tailored resumes.\n")
+        
+        # Each pdflatex run is a separate single-threaded process, so compile the
+        # documents side by side, one per core
+        compile_slots = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def save_one(job_description, job_title, response):
+            if isinstance(response, Exception):
+                self.logger.error(f"Error tailoring resume for {job_title or 'Untitled Position'}: {response}")
+                return response
+                
+            _, tailored_content = response
+            async with compile_slots:
+                try:
+                    return await asyncio.to_thread(
+                        self.save_tailored_resume, tailored_content, resume_file, job_title, company,
+                        show_progress=False
+                    )
+                except ValueError as e:
+                    self.logger.error(f"Tailored resume for {job_title or 'Untitled Position'} failed to compile: {e}")
+                    self._evict_cache('tailor', self._tailor_cache_key(job_description, original_content))
+                    return e
+        
+        if self.verbose:
+            self.spinner.start("Compiling tailored resumes to PDF...")
+            
+        results = await asyncio.gather(
+            *(save_one(unique_descriptions[" ".join(job_description.split())], job_title, response)
+              for job_description, job_title, response in zip(job_descriptions, job_titles, responses))
+        )
+        
+        if self.verbose:
+            compiled = sum(1 for result in results if not isinstance(result, Exception))
+            self.spinner.stop(f"✓ Compiled {compiled} of {len(results)} tailored resumes.\n")
+                
+        return list(results)
+
+
+def _expand_arg_files(parser, argv):
+    """Replace each "@file" argument with the arguments listed in that file.
+    
+    Unlike argparse's fromfile_prefix_chars, an "@..." value given to an option such
+    as --notes is left alone, so free text may start with "@".
+    
+    Args:
+        parser: Parser whose options decide which arguments are option values.
+        argv: Command-line arguments, without the program name.
+        
+    Returns:
+        list: Arguments with argument files expanded, recursively.
+    """
+    takes_value = {
+        option
+        for action in parser._actions
+        if action.nargs is None
+        for option in action.option_strings
+    }
+    
+    expanded = []
+    for arg in argv:
+        if not arg.startswith("@") or (expanded and expanded[-1] in takes_value):
+            expanded.append(arg)
+            continue
+            
+        try:
+            lines = Path(arg[1:]).read_text(encoding='utf-8').splitlines()
+        except OSError as e:
+            parser.error(str(e))
+            
+        # Split each line shell-style rather than treating it as a single argument
+        file_args = [file_arg for line in lines for file_arg in shlex.split(line, comments=True)]
+        expanded.extend(_expand_arg_files(parser, file_args))
+        
+    return expanded
+
 
 def main():
     """Command-line entry point."""
-    parser = argparse.ArgumentParser(description="Tailor your LaTeX resume to specific job descriptions")
+    parser = argparse.ArgumentParser(
+        description="Tailor your LaTeX resume to specific job descriptions"
+    )
     
     parser.add_argument("resume_file", help="Path to your original LaTeX resume file", nargs="?")
     parser.add_argument("--job-title", help="Job title for the position (used in filename and logs)")
@@ -594,10 +1611,13 @@ def main():
     parser.add_argument("--api-key", help="Anthropic API key (or set ANTHROPIC_API_KEY environment variable)")
     parser.add_argument("--output-dir", help="Directory to store all outputs (default: ./resume_output)")
     parser.add_argument("--quiet", "-q", action="store_true", help="Suppress progress animations and detailed output")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached Claude responses and request fresh ones")
     
     job_desc_group = parser.add_mutually_exclusive_group()
     job_desc_group.add_argument("--job-description", help="Job description text")
     job_desc_group.add_argument("--job-file", help="File containing the job description")
+    job_desc_group.add_argument("--job-files", nargs="+", help="Several job description files to tailor the resume to concurrently")
+    parser.add_argument("--batch", action="store_true", help="With --job-files, use the Message Batches API (half price, but results may take hours)")
     
     # Status updating
     parser.add_argument("--update", type=int, help="Update application status for resume ID")
@@ -608,11 +1628,13 @@ def main():
     # Utility options
     parser.add_argument("--list", action="store_true", help="List all previously created resumes")
     
-    args = parser.parse_args()
+    # "@args.txt" expands to the arguments listed in that file, so a long batch of
+    # --job-files can be kept in a file and run in one process
+    args = parser.parse_args(_expand_arg_files(parser, sys.argv[1:]))
     
     # Initialize the resume tailor with verbosity setting
     verbose = not args.quiet
-    tailor = ResumeTailor(api_key=args.api_key, output_dir=args.output_dir, verbose=verbose)
+    tailor = ResumeTailor(api_key=args.api_key, output_dir=args.output_dir, verbose=verbose, use_cache=not args.no_cache)
     
     # List all applications
     if args.list:
@@ -620,36 +1642,39 @@ def main():
             print("No resume applications found in the log.")
             return
             
-        print("\n=== Resume Applications ===\n")
+        # Collect the listing and write it once instead of printing line by line
+        lines = ["", "=== Resume Applications ===", ""]
         for app in tailor.applications:
-            status = "✅ Applied" if app.get('applied') else "📝 Not Applied"
-            created_date = datetime.datetime.fromisoformat(app.get('date_created')).strftime("%Y-%m-%d")
+            status = APPLICATION_STATUS_LABELS[bool(app.get('applied'))]
+            # Stored timestamps are ISO 8601, so the date is the first ten characters
+            created_date = app.get('date_created')[:10]
             
-            print(f"ID: {app.get('id')} - {app.get('job_title')} - {status}")
-            print(f"  Created: {created_date}")
+            lines.append(f"ID: {app.get('id')} - {app.get('job_title')} - {status}")
+            lines.append(f"  Created: {created_date}")
             
             if app.get('company'):
-                print(f"  Company: {app.get('company')}")
+                lines.append(f"  Company: {app.get('company')}")
                 
             if app.get('applied') and app.get('application_date'):
-                applied_date = datetime.datetime.fromisoformat(app.get('application_date')).strftime("%Y-%m-%d")
-                print(f"  Applied: {applied_date}")
+                applied_date = app.get('application_date')[:10]
+                lines.append(f"  Applied: {applied_date}")
                 
-            print(f"  Resume: {os.path.basename(app.get('tailored_resume'))}")
+            lines.append(f"  Resume: {os.path.basename(app.get('tailored_resume'))}")
             
             if app.get('pdf_resume'):
-                print(f"  PDF: {os.path.basename(app.get('pdf_resume'))}")
+                lines.append(f"  PDF: {os.path.basename(app.get('pdf_resume'))}")
                 
             if app.get('job_link'):
-                print(f"  Link: {app.get('job_link')}")
+                lines.append(f"  Link: {app.get('job_link')}")
                 
             if app.get('notes'):
-                print(f"  Notes: {app.get('notes')}")
+                lines.append(f"  Notes: {app.get('notes')}")
                 
-            print()
+            lines.append("")
         
-        print(f"Total: {len(tailor.applications)} resume(s)")
-        print(f"Output directory: {os.path.abspath(tailor.output_dir)}")
+        lines.append(f"Total: {len(tailor.applications)} resume(s)")
+        lines.append(f"Output directory: {os.path.abspath(tailor.output_dir)}")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
     # If updating application status
@@ -670,8 +1695,41 @@ def main():
     if not args.resume_file:
         parser.error("resume_file is required unless using --list or --update")
     
-    if not args.job_description and not args.job_file:
-        parser.error("Either --job-description or --job-file is required")
+    if not args.job_description and not args.job_file and not args.job_files:
+        parser.error("Either --job-description, --job-file or --job-files is required")
+    
+    if args.batch and not args.job_files:
+        parser.error("--batch can only be used with --job-files")
+    
+    if args.job_title and args.job_files:
+        parser.error("--job-title can't be combined with --job-files; each file's name is used as its job title")
+    
+    # Tailor to several job descriptions at once; each file's name becomes its job title
+    if args.job_files:
+        try:
+            job_descriptions = [Path(job_file).read_text(encoding='utf-8') for job_file in args.job_files]
+        except Exception as e:
+            print(f"Error reading job description file: {e}")
+            return
+            
+        job_titles = [Path(job_file).stem for job_file in args.job_files]
+        results = asyncio.run(tailor.tailor_many(
+            args.resume_file,
+            job_descriptions,
+            job_titles=job_titles,
+            company=args.company,
+            use_batch_api=args.batch
+        ))
+        
+        for job_file, result in zip(args.job_files, results):
+            if isinstance(result, Exception):
+                print(f"❌ {job_file}: {result}")
+            else:
+                print(f"✅ {job_file}: {result['tailored_resume']} (ID {result['id']})")
+                
+        if any(isinstance(result, Exception) for result in results):
+            sys.exit(1)
+        return
     
     # Get job description
     job_description = None
@@ -679,15 +1737,14 @@ def main():
         job_description = args.job_description
     elif args.job_file:
         try:
-            with open(args.job_file, 'r', encoding='utf-8') as f:
-                job_description = f.read()
+            job_description = Path(args.job_file).read_text(encoding='utf-8')
         except Exception as e:
             print(f"Error reading job description file: {e}")
             return
     
     # Tailor the resume
     try:
-        new_file_path = tailor.tailor_resume(
+        application = tailor.tailor_resume(
             args.resume_file,
             job_description,
             job_title=args.job_title,
@@ -695,7 +1752,7 @@ def main():
         )
         
         if verbose:
-            print(f"Application ID for future reference: {tailor.applications[-1]['id']}")
+            print(f"Application ID for future reference: {application['id']}")
         
     except Exception as e:
         print(f"Error tailoring resume: {e}")
@@ -5,8 +5,12 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "anthropic>=0.21.0",
+        "anthropic>=0.40.0",
     ],
+    extras_require={
+        # Faster JSON for the applications log and response cache
+        "fast": ["orjson>=3.6.0"],
+    },
     entry_points={
         "console_scripts": [
             "resume_tailor=resume_tailor:main",
@@ -23,5 +27,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
 )